@@ -16,6 +16,7 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url="https://github.com/SpectralSequences/sseq",
     packages=setuptools.find_packages(),
+    extras_require={"fast": ["orjson"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -1,7 +1,6 @@
 """ SseqChart is the main class which holds the data structure representing the chart."""
 
 import asyncio
-import threading
 from typing import Any, Dict, Iterable, List, Set, Tuple, Union
 from uuid import uuid4
 
@@ -38,10 +37,13 @@ class SseqChart:
 
         self._agent: Any = None
         self._batched_messages: list[dict[str, Any]] = []
+        # The update task that has been scheduled but hasn't started yet, and all unfinished update tasks
+        # (the event loop only holds weak references to tasks). See SseqChart.update.
+        self._pending_update_task: Any = None
+        self._update_tasks: set[Any] = set()
         # type: ignore
         self._update_keys: dict[str, int] = {}
         self._global_fields_to_update: set[str] = set()
-        self._batched_messages_lock = threading.Lock()
 
         self._uuid = str(uuid4())
         self._objects_by_uuid = {}
@@ -67,7 +69,6 @@ class SseqChart:
 
         self.register_shape("stdcircle", Shape.circle(5))
 
-        self._page_list_lock = threading.Lock()
         self._classes: dict[str, ChartClass] = {}
         self._edges: dict[str, ChartEdge] = {}
         self._classes_by_degree: dict[tuple[int, ...], list[ChartClass]] = {}
@@ -202,7 +203,7 @@ class SseqChart:
             The `ChartClass` added.
         """
         assert len(degree) == self.num_gradings
-        idx = len(self._classes_by_degree.get(degree, []))
+        idx = len(self._classes_by_degree.get(degree, ()))
         c = ChartClass(degree, idx)
         c._sseq = self
         c.set_style(self.default_class_style)
@@ -221,9 +222,11 @@ class SseqChart:
         self._add_create_message(c)
         self._classes[c.uuid] = c
         self._objects_by_uuid[c.uuid] = c
-        if c.degree not in self._classes_by_degree:
-            self._classes_by_degree[c.degree] = []
-        self._classes_by_degree[c.degree].append(c)
+        # A single probe in the common case that the degree already has classes.
+        classes_in_degree = self._classes_by_degree.get(c.degree)
+        if classes_in_degree is None:
+            classes_in_degree = self._classes_by_degree[c.degree] = []
+        classes_in_degree.append(c)
         c._initialized = True
 
     def add_differential(
@@ -323,18 +326,17 @@ class SseqChart:
         through the page views the new page range should be included.
         """
         page_range = (page_min, page_max)
-        if page_range in self.page_list:
-            return
-        with self._page_list_lock:
-            if page_range in self.page_list:
+        # Membership test and insertion point in one pass. page_list is user-assignable, so don't assume
+        # it is sorted or that every entry is a tuple.
+        idx = None
+        for (i, p) in enumerate(self.page_list):
+            if tuple(p) == page_range:
                 return
-            for (i, p) in enumerate(self.page_list):
-                if p[0] > page_range[0]:
-                    idx = i
-                    break
-            else:
-                idx = len(self.page_list)
-            self.page_list.insert(idx, page_range)
+            if idx is None and p[0] > page_min:
+                idx = i
+        if idx is None:
+            idx = len(self.page_list)
+        self.page_list.insert(idx, page_range)
 
     def _add_class_to_update(self, c: ChartClass):
         self._add_update_message(c)
@@ -349,17 +351,12 @@ class SseqChart:
         self._add_delete_message(e)
 
     def _add_batched_message(self, key: str, kwargs: dict[str, Any], replace=False):
-        """If replace is False, then if key"""
+        """If a message with the same key is already batched, then if replace is True the new message
+        replaces it and otherwise the new message is dropped.
+        """
+        # All access to the batch happens on the event loop thread, so no locking is needed here.
         if not self._initialized:
             return
-        if key in self._update_keys and not replace:
-            return
-        with self._batched_messages_lock:
-            self._add_batched_message_raw(key, kwargs, replace)
-
-    def _add_batched_message_raw(self, key: str, kwargs: dict[str, Any], replace):
-        # If we're actually bothering with locking we need to check again to make sure
-        # key is not in dict to make sure that it didn't get inserted before we got the lock.
         if key in self._update_keys:
             if replace:
                 self._batched_messages[self._update_keys[key]] = kwargs
@@ -465,8 +462,10 @@ class SseqChart:
         )
 
     def _clear_batched_messages(self):
+        # The old message list has been handed off to the agent, so it needs a fresh one,
+        # but the key index is private and can be cleared in place.
         self._batched_messages = []
-        self._update_keys = {}
+        self._update_keys.clear()
 
     @property
     def display(self):
@@ -477,8 +476,42 @@ class SseqChart:
         This will send a message to the display instructing it about how to
         "catch up with" the current state of the `SseqChart` in the Python runtime.
         This is a wrapper around `SseqChart.update_a`.
+        Repeated calls before the update runs are coalesced into a single update.
+        Must be called while an event loop is running, otherwise raises `RuntimeError`.
+        If the update fails, the exception is passed to the display's ``handle_exception_a`` if it has one,
+        and otherwise to the event loop's exception handler.
         """
-        asyncio.get_event_loop().call_soon(self.update_a())
+        loop = asyncio.get_running_loop()
+        if self._pending_update_task is not None:
+            return
+        task = loop.create_task(self._scheduled_update_a())
+        self._pending_update_task = task
+        self._update_tasks.add(task)
+        task.add_done_callback(self._update_task_done)
+
+    async def _scheduled_update_a(self):
+        self._pending_update_task = None
+        await self.update_a()
+
+    def _update_task_done(self, task: "asyncio.Task[None]"):
+        self._update_tasks.discard(task)
+        if self._pending_update_task is task:
+            # Cancelled before it started.
+            self._pending_update_task = None
+        if task.cancelled():
+            return
+        exception = task.exception()
+        if exception is None:
+            return
+        handle_exception_a = getattr(self._agent, "handle_exception_a", None)
+        if handle_exception_a is not None:
+            handler_task = task.get_loop().create_task(handle_exception_a(exception))
+            self._update_tasks.add(handler_task)
+            handler_task.add_done_callback(self._update_tasks.discard)
+            return
+        task.get_loop().call_exception_handler(
+            dict(message="Exception in SseqChart.update", exception=exception, task=task)
+        )
 
     async def update_a(self):
         """If the chart is attached to a display, update the attached display.
@@ -487,12 +520,12 @@ class SseqChart:
         This is an asynchronous method and must be called like ``await chart.update_a()``.
         See `SseqChart.update` for a convenient synchronous wrapper.
         """
-        with self._batched_messages_lock:
-            if not self._batched_messages:
-                return
-            if self._agent:
-                await self._agent.send_batched_messages_a(self._batched_messages)
-            self._clear_batched_messages()
+        # Take the current batch before awaiting the agent. Anything added while the agent
+        # is sending ends up in the next batch rather than being cleared unsent.
+        messages = self._batched_messages
+        self._clear_batched_messages()
+        if messages and self._agent:
+            await self._agent.send_batched_messages_a(messages)
 
     async def save_a(self, *args, **kwargs):
         if not self._agent or not hasattr(self._agent, "save_a"):
@@ -15,6 +15,11 @@ if TYPE_CHECKING:
     from .chart import SseqChart
     from .chart_edge import ChartEdge
 
+# Placeholder style values for a fresh ChartClass. They are always replaced by set_style or
+# from_json, so every class can share the same instances rather than building new ones.
+_PLACEHOLDER_SHAPE = Shape().circled(5)
+_PLACEHOLDER_COLOR = Color(0, 0, 0, 1)
+
 
 class ChartClassStyle:
     """The data that determine the visual style of a class on a particular page.
@@ -129,6 +134,32 @@ class ChartClass:
     the image of a differential or supports a nontrivial differential.
     """
 
+    # Charts can have tens of thousands of classes, so store the fixed fields in slots.
+    # Keep __dict__ so that arbitrary extra attributes can still be set.
+    __slots__ = (
+        "_deleted",
+        "_initialized",
+        "_sseq",
+        "_degree",
+        "_idx",
+        "_max_page",
+        "_edges",
+        "_uuid",
+        "_group_name",
+        "_shape",
+        "_background_color",
+        "_border_color",
+        "_foreground_color",
+        "_border_width",
+        "_name",
+        "_scale",
+        "_visible",
+        "_x_nudge",
+        "_y_nudge",
+        "_user_data",
+        "__dict__",
+    )
+
     def __init__(self, degree: tuple[int, ...], idx: int):
         """Do not call `ChartClass` constructor directly, use instead `SseqChart.add_class`, or `JSON.parse`."""
         self._deleted = False
@@ -142,10 +173,10 @@ class ChartClass:
 
         # These values don't really matter, just need to initialize the PageProperties or set_style will raise.
         self.group_name = ""
-        self.shape = Shape().circled(5)
-        self.background_color = Color(0, 0, 0, 1)
-        self.border_color = Color(0, 0, 0, 1)
-        self.foreground_color = Color(0, 0, 0, 1)
+        self.shape = _PLACEHOLDER_SHAPE
+        self.background_color = _PLACEHOLDER_COLOR
+        self.border_color = _PLACEHOLDER_COLOR
+        self.foreground_color = _PLACEHOLDER_COLOR
         self.border_width = 2
 
         self.name = ""
@@ -126,6 +126,20 @@ class ChartEdgeStyle:
 class ChartEdge(ABC):
     """ChartEdge is the base class of ChartStructline, ChartDifferential, and ChartExtension."""
 
+    # As with ChartClass, the fixed fields live in slots and __dict__ is kept for anything extra.
+    __slots__ = (
+        "_deleted",
+        "_initialized",
+        "_sseq",
+        "_source_uuid",
+        "_target_uuid",
+        "_source",
+        "_target",
+        "_uuid",
+        "_user_data",
+        "__dict__",
+    )
+
     def __init__(self, source_uuid: UUID_str, target_uuid: UUID_str):
         """Do not call SseqEdge constructor directly, use instead SseqChart.add_structline(),
         SseqChart.add_differential(), SseqChart.add_extension(), or JSON.parse()."""
@@ -186,20 +200,20 @@ class ChartEdge(ABC):
         self._deleted = True
 
     _EDGE_TYPE_DICT: dict[str, type]
+    _INIT_ARG_KEYS = ("source_uuid", "target_uuid", "page")
 
     @staticmethod
     def from_json(json: dict[str, Any]) -> "ChartEdge":
-        if not hasattr(ChartEdge, "EDGE_TYPE_DICT"):
+        if not hasattr(ChartEdge, "_EDGE_TYPE_DICT"):
             ChartEdge._EDGE_TYPE_DICT = {
                 edge_type.__name__: edge_type
                 for edge_type in [ChartStructline, ChartDifferential, ChartExtension]
             }
         edge_type = json["type"]
         if edge_type in ChartEdge._EDGE_TYPE_DICT:
-            init_args = {}
-            for key in ["source_uuid", "target_uuid", "page"]:
-                if key in json:
-                    init_args[key] = json.pop(key)
+            init_args = {
+                key: json.pop(key) for key in ChartEdge._INIT_ARG_KEYS if key in json
+            }
             edge = ChartEdge._EDGE_TYPE_DICT[edge_type](**init_args)
             edge._from_json_helper(**json)
             return edge
@@ -258,6 +272,17 @@ class ChartStructline(ChartEdge):
     is true and both the source and the target class of the structure line are visible.
     """
 
+    __slots__ = (
+        "_action",
+        "_color",
+        "_dash_pattern",
+        "_line_width",
+        "_bend",
+        "_start_tip",
+        "_end_tip",
+        "_visible",
+    )
+
     def __init__(self, source_uuid: UUID_str, target_uuid: UUID_str):
         super().__init__(source_uuid, target_uuid)
         self.action = ""
@@ -320,12 +345,9 @@ class ChartStructline(ChartEdge):
         )
 
     def to_json(self) -> dict[str, Any]:
-        return dict(
-            super().to_json(),
-            type=self.__class__.__name__,
-            uuid=self.uuid,
-            source_uuid=self._source_uuid,
-            target_uuid=self._target_uuid,
+        # ChartEdge.to_json already fills in the common fields, extend its dict in place.
+        result = super().to_json()
+        result.update(
             action=self.action,
             color=self.color,
             dash_pattern=self.dash_pattern,
@@ -334,8 +356,8 @@ class ChartStructline(ChartEdge):
             start_tip=self.start_tip,
             end_tip=self.end_tip,
             visible=self.visible,
-            user_data=self._user_data,
         )
+        return result
 
     def _from_json_helper(
         self,
@@ -453,6 +475,17 @@ class ChartStructline(ChartEdge):
 class SinglePageChartEdge(ChartEdge):
     """SinglePageChartEdge handles most of the common code between ChartDifferential and ChartExtension."""
 
+    __slots__ = (
+        "_action",
+        "_color",
+        "_dash_pattern",
+        "_line_width",
+        "_bend",
+        "_start_tip",
+        "_end_tip",
+        "_visible",
+    )
+
     def __init__(self, source_uuid: UUID_str, target_uuid: UUID_str):
         super().__init__(source_uuid, target_uuid)
         self._action = ""
@@ -498,12 +531,9 @@ class SinglePageChartEdge(ChartEdge):
         )
 
     def to_json(self) -> dict[str, Any]:
-        return dict(
-            super().to_json(),
-            type=self.__class__.__name__,
-            uuid=self.uuid,
-            source_uuid=self._source_uuid,
-            target_uuid=self._target_uuid,
+        # ChartEdge.to_json already fills in the common fields, extend its dict in place.
+        result = super().to_json()
+        result.update(
             action=self.action,
             color=self.color,
             start_tip=self.start_tip,
@@ -512,8 +542,8 @@ class SinglePageChartEdge(ChartEdge):
             line_width=self.line_width,
             bend=self.bend,
             visible=self.visible,
-            user_data=self._user_data,
         )
+        return result
 
     def _from_json_helper(
         self,
@@ -629,12 +659,16 @@ class ChartDifferential(SinglePageChartEdge):
     and if both the source and target of the differential appear on page <page>.
     """
 
+    __slots__ = ("page",)
+
     def __init__(self, source_uuid: UUID_str, target_uuid: UUID_str, page: int):
         super().__init__(source_uuid, target_uuid)
         self.page: int = page
 
     def to_json(self) -> dict[str, Any]:
-        return dict(super().to_json(), page=self.page)
+        result = super().to_json()
+        result["page"] = self.page
+        return result
 
 
 class ChartExtension(SinglePageChartEdge):
@@ -644,4 +678,4 @@ class ChartExtension(SinglePageChartEdge):
     and both the source and the target of the extension appear on page infinity.
     """
 
-    pass
+    __slots__ = ()
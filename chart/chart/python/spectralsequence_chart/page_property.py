@@ -79,8 +79,9 @@ class PageProperty(Generic[T]):
         return self._values[idx][1]
 
     def __setitem__(self, p: Union[int, slice], v: T) -> None:
-        if hasattr(v, "set_parent"):
-            v.set_parent(self)
+        set_parent = getattr(v, "set_parent", None)
+        if set_parent is not None:
+            set_parent(self)
         if type(p) is int:
             self._setitem_single(p, v)
             self._merge_redundant()
@@ -1,14 +1,30 @@
 import json
-from typing import Any, Dict, Tuple, Union, cast  # , Protocol
+import math
+import re
+from typing import Any, Callable, Dict, Tuple, Union, cast  # , Protocol
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional (for instance it is unavailable in pyodide), fall back to the json module.
+    orjson = None
+
+# orjson reads integer literals that don't fit in 64 bits as floats, losing precision. Any run of 19 or more
+# digits might be one of those (it might also be inside a string or a float, we don't bother telling apart).
+_LONG_DIGIT_RUN = re.compile(r"\d{19,}")
 
 # Protocol absent from Python 3.6, comment out until I figure out how to get sphinx to use python 3.8
 
 
 def stringifier(obj: Any) -> Union[str, dict[str, Any]]:
-    if hasattr(obj, "to_json"):
-        return obj.to_json()
-    elif hasattr(obj, "__dict__"):
-        return obj.__dict__
+    # This is called once for every nontrivial object we serialize, so use a single
+    # getattr with a default rather than probing with hasattr and then looking up again.
+    to_json = getattr(obj, "to_json", None)
+    if to_json is not None:
+        return to_json()
+    obj_dict = getattr(obj, "__dict__", None)
+    if obj_dict is not None:
+        return obj_dict
     elif obj is None:
         return None
     else:
@@ -22,29 +38,130 @@ class Serializable:  # (Protocol):
         return Serializable()
 
 
+class _NonFiniteFloat(Exception):
+    pass
+
+
+def _check_finite(obj: Any):
+    """orjson writes inf and nan as null, while the json module writes Infinity and NaN, which JSON.parse reads back.
+    Raise _NonFiniteFloat if obj has a non-finite float in it, so that JSON.stringify can fall back to the json module.
+    Other objects are checked when orjson hands them to _orjson_default.
+    """
+    ty = type(obj)
+    kind = _kind_by_type.get(ty) or _classify_type(ty)
+    if kind is _OTHER:
+        return
+    if kind is _FLOAT:
+        if not math.isfinite(obj):
+            raise _NonFiniteFloat()
+        return
+    for value in obj.values() if kind is _MAPPING else obj:
+        ty = type(value)
+        if (_kind_by_type.get(ty) or _classify_type(ty)) is not _OTHER:
+            _check_finite(value)
+
+
+# What _check_finite needs to do with values of a given type, decided once per type since this runs for every
+# value in the chart. Subclasses count too: orjson encodes dict and list subclasses without asking us.
+_OTHER = "other"
+_FLOAT = "float"
+_MAPPING = "mapping"
+_SEQUENCE = "sequence"
+_kind_by_type: dict[type, str] = {}
+
+
+def _classify_type(ty: type) -> str:
+    if issubclass(ty, float):
+        kind = _FLOAT
+    elif issubclass(ty, dict):
+        kind = _MAPPING
+    elif issubclass(ty, (list, tuple)):
+        kind = _SEQUENCE
+    else:
+        kind = _OTHER
+    _kind_by_type[ty] = kind
+    return kind
+
+
+def _orjson_default(obj: Any) -> Any:
+    # orjson encodes exact floats and tuples itself but hands subclasses of them (e.g., namedtuples) to us.
+    # Encode those the same way the json module does.
+    ty = type(obj)
+    kind = _kind_by_type.get(ty) or _classify_type(ty)
+    if kind is _FLOAT:
+        _check_finite(obj)
+        return float(obj)
+    if kind is _SEQUENCE:
+        _check_finite(obj)
+        return list(obj)
+    result = stringifier(obj)
+    _check_finite(result)
+    return result
+
+
+def _rehydrate(obj: Any) -> Any:
+    """orjson has no object_hook, so apply JSON.parser_object_hook to the parsed result ourselves.
+    Like object_hook, this works from the inside out so that the hook always sees fully parsed children.
+    """
+    if type(obj) is dict:
+        for (key, value) in obj.items():
+            if type(value) is dict or type(value) is list:
+                obj[key] = _rehydrate(value)
+        return JSON.parser_object_hook(obj)
+    if type(obj) is list:
+        for (idx, value) in enumerate(obj):
+            if type(value) is dict or type(value) is list:
+                obj[idx] = _rehydrate(value)
+    return obj
+
+
+_types_initialized = False
+# type name ==> bound from_json, so that parser_object_hook does one dict lookup per object.
+_from_json_by_type: dict[str, Callable[[dict[str, Any]], Any]] = {}
+
+
 class JSON:
     @staticmethod
     def stringify(obj: Any):
         # sort_keys needed to ensure that object equality ==> string equality,
         # useful for ease of testing.
+        if orjson is not None:
+            try:
+                _check_finite(obj)
+                return orjson.dumps(
+                    obj,
+                    default=_orjson_default,
+                    option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+                ).decode()
+            except (orjson.JSONEncodeError, _NonFiniteFloat):
+                # orjson only handles 64 bit integers and writes inf / nan as null, let the json module have a go.
+                pass
         return json.dumps(obj, default=stringifier, sort_keys=True)
 
     @staticmethod
     def parse(json_str: str) -> Any:
+        if orjson is not None and not _LONG_DIGIT_RUN.search(json_str):
+            try:
+                return _rehydrate(orjson.loads(json_str))
+            except orjson.JSONDecodeError:
+                pass
         return json.loads(json_str, object_hook=JSON.parser_object_hook)
 
     @staticmethod
     def parser_object_hook(json_dict: dict[str, Any]) -> Any:
-        JSON.ensure_types_are_initialized()
-        if "type" not in json_dict:
+        if not _types_initialized:
+            JSON.ensure_types_are_initialized()
+        type_name = json_dict.get("type")
+        if type_name is None:
             return json_dict
-        return JSON.types[json_dict["type"]].from_json(json_dict)
+        return _from_json_by_type[type_name](json_dict)
 
     types: dict[str, Serializable]
 
     @staticmethod
     def ensure_types_are_initialized():
-        if hasattr(JSON, "types"):
+        global _types_initialized
+        if _types_initialized:
             return
         from .chart import SseqChart
         from .chart_class import ChartClass, ChartClassStyle
@@ -72,3 +189,7 @@ class JSON:
                 SignalList,
             ]
         }
+        _from_json_by_type.update(
+            (name, t.from_json) for (name, t) in JSON.types.items()
+        )
+        _types_initialized = True
@@ -44,13 +44,15 @@ class SignalDict(MutableMapping, Generic[T]):
         assert json.pop("type") == cls.__name__
         result = SignalDict(json)
         for v in result.values():
-            if hasattr(v, "set_parent"):
-                v.set_parent(result)
+            set_parent = getattr(v, "set_parent", None)
+            if set_parent is not None:
+                set_parent(result)
         return result
 
     def __setitem__(self, key: str, val: T):
-        if hasattr(val, "set_parent"):
-            val.set_parent(self)
+        set_parent = getattr(val, "set_parent", None)
+        if set_parent is not None:
+            set_parent(self)
         self._needs_update()
         self._dict[key] = val
 
@@ -102,8 +104,9 @@ class SignalList(MutableSequence, Generic[T]):
         assert json.pop("type") == cls.__name__
         result = SignalList(json["list"])
         for value in result:
-            if hasattr(value, "set_parent"):
-                value.set_parent(result)
+            set_parent = getattr(value, "set_parent", None)
+            if set_parent is not None:
+                set_parent(result)
         return result
 
     def _needs_update(self):
@@ -116,8 +119,9 @@ class SignalList(MutableSequence, Generic[T]):
         self._needs_update()
         self._list[key] = vals
         for val in self._list[key]:
-            if hasattr(val, "set_parent"):
-                val.set_parent(self)
+            set_parent = getattr(val, "set_parent", None)
+            if set_parent is not None:
+                set_parent(self)
         return
 
     def __getitem__(self, key: slice) -> T:
@@ -0,0 +1,33 @@
+from spectralsequence_chart import SseqChart
+from spectralsequence_chart.serialization import JSON
+
+
+def test_add_page_range():
+    chart = JSON.parse(JSON.stringify(SseqChart("test")))
+    chart.add_page_range(3, 3)
+    chart.add_page_range(2, 2)
+    chart.add_page_range(3, 3)
+    chart.add_page_range(2, 65535)
+    # Ranges loaded from JSON are lists, ranges added by add_page_range are tuples.
+    assert [tuple(p) for p in chart.page_list] == [
+        (2, 65535),
+        (2, 2),
+        (3, 3),
+        (65535, 65535),
+    ]
+
+
+def test_add_page_range_unsorted():
+    chart = SseqChart("test")
+    chart.page_list = [(5, 5), (2, 2)]
+    chart.add_page_range(5, 5)
+    assert list(chart.page_list) == [(5, 5), (2, 2)]
+
+
+def test_add_page_range_list_entries():
+    chart = SseqChart("test")
+    chart.page_list = []
+    chart.page_list.append([2, 2])
+    chart.add_page_range(2, 2)
+    chart.add_page_range(3, 3)
+    assert list(chart.page_list) == [[2, 2], (3, 3)]
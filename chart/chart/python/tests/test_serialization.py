@@ -1,3 +1,7 @@
+import json
+import math
+from collections import OrderedDict, defaultdict, namedtuple
+
 from spectralsequence_chart import SseqChart
 from spectralsequence_chart.serialization import JSON
 
@@ -41,3 +45,40 @@ def test_serialize():
     for c in chart.classes:
         double_serialize_assert(c)
     double_serialize_assert(chart)
+
+
+def test_large_integer_user_data():
+    chart = single_structline_chart()
+    chart.classes[0].user_data["big"] = (1 << 70) + 1
+    chart2 = serialize_parse(chart)
+    big = chart2.classes[0].user_data["big"]
+    assert type(big) is int
+    assert big == (1 << 70) + 1
+
+
+def test_non_finite_float_user_data():
+    chart = single_structline_chart()
+    chart.classes[0].user_data["inf"] = float("inf")
+    chart.classes[0].user_data["nan"] = float("nan")
+    chart2 = serialize_parse(chart)
+    assert chart2.classes[0].user_data["inf"] == float("inf")
+    assert math.isnan(chart2.classes[0].user_data["nan"])
+
+
+def test_non_finite_float_in_container_subclass():
+    assert json.loads(JSON.stringify({"u": defaultdict(float, x=math.inf)})) == {
+        "u": {"x": math.inf}
+    }
+    [d] = json.loads(JSON.stringify([OrderedDict(a=math.nan)]))
+    assert math.isnan(d["a"])
+
+
+def test_float_and_tuple_subclass():
+    class F(float):
+        pass
+
+    Pair = namedtuple("Pair", ["a", "b"])
+    assert json.loads(JSON.stringify({"b": F(2.5), "p": Pair(1, math.inf)})) == {
+        "b": 2.5,
+        "p": [1, math.inf],
+    }
@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+
+from spectralsequence_chart import SseqChart
+
+
+class RecordingAgent:
+    def __init__(self, chart):
+        self.chart = chart
+        self.batches = []
+
+    async def send_batched_messages_a(self, messages):
+        self.batches.append(messages)
+        if len(self.batches) == 1:
+            # Simulate another coroutine modifying the chart while we are sending.
+            self.chart.add_class(1, 0)
+        await asyncio.sleep(0)
+
+
+def test_update_during_send():
+    chart = SseqChart("test")
+    chart._agent = agent = RecordingAgent(chart)
+    chart.add_class(0, 0)
+    asyncio.run(chart.update_a())
+    assert len(agent.batches) == 1
+    asyncio.run(chart.update_a())
+    assert len(agent.batches) == 2
+    [msg] = agent.batches[1]
+    assert msg["command"] == "create"
+    assert msg["target"].degree == (1, 0)
+
+
+class PlainAgent:
+    def __init__(self):
+        self.batches = []
+
+    async def send_batched_messages_a(self, messages):
+        self.batches.append(messages)
+
+
+def test_update_coalesces():
+    chart = SseqChart("test")
+    chart._agent = agent = PlainAgent()
+
+    async def build_chart():
+        for x in range(3):
+            chart.add_class(x, 0)
+            chart.update()
+        await asyncio.sleep(0.01)
+
+    asyncio.run(build_chart())
+    assert len(agent.batches) == 1
+    assert len(agent.batches[0]) == 3
+
+
+def test_update_without_running_loop():
+    chart = SseqChart("test")
+    chart._agent = agent = PlainAgent()
+    with pytest.raises(RuntimeError):
+        chart.update()
+
+    async def build_chart():
+        chart.add_class(0, 0)
+        chart.update()
+        await asyncio.sleep(0.01)
+
+    asyncio.run(build_chart())
+    assert len(agent.batches) == 1
+
+
+class FailingAgent(PlainAgent):
+    def __init__(self):
+        super().__init__()
+        self.exceptions = []
+
+    async def send_batched_messages_a(self, messages):
+        await asyncio.sleep(0)
+        self.batches.append(messages)
+        if len(self.batches) <= 2:
+            raise RuntimeError(f"send {len(self.batches)} failed")
+
+    async def handle_exception_a(self, exception):
+        self.exceptions.append(exception)
+
+
+def test_update_failure_is_reported():
+    chart = SseqChart("test")
+    chart._agent = agent = FailingAgent()
+
+    async def build_chart():
+        chart.add_class(0, 0)
+        chart.update()
+        await asyncio.sleep(0)
+        # The first update is running now, this schedules a second one.
+        chart.add_class(1, 0)
+        chart.update()
+        await asyncio.sleep(0.01)
+        chart.add_class(2, 0)
+        chart.update()
+        await asyncio.sleep(0.01)
+
+    asyncio.run(build_chart())
+    assert [str(e) for e in agent.exceptions] == ["send 1 failed", "send 2 failed"]
+    assert len(agent.batches) == 3
+
+
+def test_update_failure_without_handler():
+    chart = SseqChart("test")
+    chart._agent = agent = FailingAgent()
+    agent.handle_exception_a = None
+    contexts = []
+
+    async def build_chart():
+        asyncio.get_running_loop().set_exception_handler(
+            lambda loop, context: contexts.append(context)
+        )
+        chart.add_class(0, 0)
+        chart.update()
+        await asyncio.sleep(0.01)
+
+    asyncio.run(build_chart())
+    [context] = contexts
+    assert str(context["exception"]) == "send 1 failed"
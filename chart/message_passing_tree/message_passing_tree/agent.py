@@ -92,6 +92,23 @@ class Agent:
                 return handler_dict[cmd_filter]
         return None
 
+    @classmethod
+    def get_class_handler(cls, direction, cmd):
+        """Look up the handler for cmd in the class handler table for direction "in" or "out".
+        The class tables are fixed once "@collect_handlers" has run, so the result is cached per class
+        and command string to save walking the filter list on every message.
+        """
+        cache = cls.__dict__.get("_class_handler_cache")
+        if cache is None:
+            cache = {}
+            cls._class_handler_cache = cache
+        key = (direction, cmd.str)
+        if key not in cache:
+            cache[key] = cls.get_handler(
+                getattr(cls, f"{direction}ward_handlers"), cmd
+            )
+        return cache[key]
+
     def __init__(self):
         if type(self).inward_handlers is None:
             raise RuntimeError(
@@ -134,7 +151,9 @@ class Agent:
         return f"mytype: {ansi.highlight(type(self).__name__)}"
 
     def log_envelope_task(self, name, envelope):
-        self.log_debug(self.envelope_task_info(name, envelope))
+        # envelope_task_info formats the entire message, so skip it unless debug logging is on.
+        if logging.getLogger(type(self).__module__).isEnabledFor(logging.DEBUG):
+            self.log_debug(self.envelope_task_info(name, envelope))
 
     def envelope_task_info(self, name, envelope):
         return f"""Task: {ansi.highlight(name)}  self: {self.info()}  envelope: {envelope.info()}"""
@@ -196,9 +215,12 @@ class Agent:
 
     async def handle_outbound_envelope_a(self, envelope: Envelope):
         self.log_envelope_task("handle_outbound_envelope", envelope)
-        handle_a = self.get_handler(self.outward_handlers, envelope.msg.cmd)
+        # Instance handler tables are almost always empty, so skip walking the filter list for them.
+        handle_a = None
+        if self.outward_handlers:
+            handle_a = self.get_handler(self.outward_handlers, envelope.msg.cmd)
         if handle_a is None:
-            handle_a = self.get_handler(type(self).outward_handlers, envelope.msg.cmd)
+            handle_a = type(self).get_class_handler("out", envelope.msg.cmd)
         if handle_a is None:
             return False
         envelope.mark_used()
@@ -209,9 +231,11 @@ class Agent:
         # for (i, (cmd_filter, evt)) in enumerate(self.inward_responses_expected):
         # if cmd_filter in envelope.msg.cmd.filter_list:
         # return True
-        handle_a = Agent.get_handler(self.inward_handlers, envelope.msg.cmd)
+        handle_a = None
+        if self.inward_handlers:
+            handle_a = Agent.get_handler(self.inward_handlers, envelope.msg.cmd)
         if handle_a is None:
-            handle_a = Agent.get_handler(type(self).inward_handlers, envelope.msg.cmd)
+            handle_a = type(self).get_class_handler("in", envelope.msg.cmd)
         if handle_a is None:
             return False
         envelope.mark_used()
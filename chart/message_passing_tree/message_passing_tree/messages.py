@@ -12,20 +12,29 @@ class Command:
         self.str = cmd_str
         self.filter_list = Command.cmdstr_to_filter_list(self.str)
         self.part_list = self.str.split(".")
+        self._tail_cache = {}
         return self
 
     def set_filter_list(self, filter_list):
         self.str = filter_list[0]
         self.filter_list = filter_list
         self.part_list = self.str.split(".")
+        self._tail_cache = {}
         return self
 
     def set_part_list(self, part_list):
         self.str = ".".join(part_list)
         self.filter_list = Command.cmdstr_to_filter_list(self.str)
         self.part_list = part_list
+        self._tail_cache = {}
         return self
 
+    def tail_from(self, n):
+        """Return the command with the first n parts dropped, e.g. "info.channel.opened" => "channel.opened" for n = 1."""
+        if n not in self._tail_cache:
+            self._tail_cache[n] = ".".join(self.part_list[n:])
+        return self._tail_cache[n]
+
     def __copy__(self):
         return Command().set_str(self.str)
 
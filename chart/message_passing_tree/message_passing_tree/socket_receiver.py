@@ -20,6 +20,8 @@ class SocketReceiver(Receiver):
         self.uuid = uuid4()
         self.accepted_connection = asyncio.Event()
         self.initialized_client = asyncio.Event()
+        # Outbound messages that arrive before the client is initialized wait here.
+        self.pending_envelopes = asyncio.Queue()
         # print("new connection")
 
     def get_uid(self) -> UUID:
@@ -30,12 +32,13 @@ class SocketReceiver(Receiver):
             return
         cmd = envelope.msg.cmd
         if not self.initialized_client.is_set() and cmd.part_list[0] != "initialize":
-            # Try again and hope for the best?
-            # Maybe we should queue these so they don't get reordered.
-            # Usually this case won't happen, but when it does it might happen many times in a row.
-            asyncio.ensure_future(self.send_message_to_socket_a(envelope))
-            # self.schedule_coroutine(self.send_message_to_socket_a(envelope))
+            # Queue the message until the client is initialized, see handle__initialize__complete__a.
+            self.pending_envelopes.put_nowait(envelope)
             return
+        await self.send_envelope_to_socket_a(envelope)
+
+    async def send_envelope_to_socket_a(self, envelope):
+        cmd = envelope.msg.cmd
         msg = {
             "cmd": cmd.filter_list,
             "args": envelope.msg.args,
@@ -124,6 +127,10 @@ class SocketReceiver(Receiver):
     @handle_inbound_messages
     async def handle__initialize__complete__a(self, envelope):
         # print("Client says it is initialized.")'
+        # Send the queued messages in order. Anything that shows up while we are sending
+        # is queued behind them, so only mark the client initialized once the queue is empty.
+        while not self.pending_envelopes.empty():
+            await self.send_envelope_to_socket_a(self.pending_envelopes.get_nowait())
         self.initialized_client.set()
 
     @handle_outbound_messages
@@ -2,10 +2,12 @@ import json
 
 
 def stringifier(obj):
-    if hasattr(obj, "to_json"):
-        return obj.to_json()
-    elif hasattr(obj, "__dict__"):
-        return obj.__dict__
+    to_json = getattr(obj, "to_json", None)
+    if to_json is not None:
+        return to_json()
+    obj_dict = getattr(obj, "__dict__", None)
+    if obj_dict is not None:
+        return obj_dict
     else:
         return str(obj)
 
@@ -14,5 +16,12 @@ def json_stringify(obj):
     return json.dumps(obj, default=stringifier)
 
 
+# Shared result for the common "arguments()" case. Message treats its kwargs as copy-on-write
+# (see Message.update_arguments), so handing out the same empty dict is safe.
+_EMPTY_ARGUMENTS = ((), {})
+
+
 def arguments(*args, **kwargs):
-    return [args, kwargs]
+    if not args and not kwargs:
+        return _EMPTY_ARGUMENTS
+    return (args, kwargs)
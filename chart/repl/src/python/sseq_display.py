@@ -14,6 +14,10 @@ from spectralsequence_chart.serialization import JSON
 
 fetcher = Fetcher("api/")
 
+# Set to True to log every batch of chart messages to the browser console.
+# Off by default: proxying the whole batch to the console is expensive for large charts.
+_DEBUG_MESSAGES = False
+
 
 def create_display(name):
     disp = SseqDisplay(name)
@@ -96,21 +100,21 @@ class SseqDisplay:
         print(f'Display started. Visit "{self.url}" to view.')
 
     async def reset_state_a(self):
-        with self.chart._batched_messages_lock:
-            self.chart._clear_batched_messages()
+        self.chart._clear_batched_messages()
         state = self.chart.to_json()
         for ui in self.ui_tabs:
             await ui.reset(state)
         await self.maybe_autosave()
 
     def update(self):
-        ensure_future(self.update_a())
+        self.chart.update()
 
     async def update_a(self):
         await self.chart.update_a()
 
     async def send_batched_messages_a(self, messages):
-        console.log("Sending batched messages:", messages)
+        if _DEBUG_MESSAGES:
+            console.log("Sending batched messages:", messages)
         await self.update_charts_a(messages=messages)
         await self.maybe_autosave()
 
@@ -125,7 +125,7 @@ class GenericDemo(Agent):
         self.executor = executor
         self.breakpoint = -1
         self.named_breakpoints = {}
-        self.user_next = asyncio.Event()
+        self.user_next = None
         self.ready_for_next_signal = asyncio.Event()
         self.next_lock = asyncio.Lock()
 
@@ -145,9 +145,9 @@ class GenericDemo(Agent):
         raise RuntimeError("You must override run!")
 
     async def wait_for_user_a(self, name=None):
-        self.user_next.clear()
+        self.user_next = asyncio.get_running_loop().create_future()
         self.ready_for_next_signal.set()
-        await self.user_next.wait()
+        await self.user_next
     
     @handle_inbound_messages
     async def handle__demo__next__a(self, envelope):
@@ -161,7 +161,9 @@ class GenericDemo(Agent):
         async with self.next_lock:
             await self.ready_for_next_signal.wait()
             self.ready_for_next_signal.clear()
-            self.user_next.set()
+            # The waiting demo task may have been cancelled (e.g., the socket closed).
+            if not self.user_next.done():
+                self.user_next.set_result(None)
 
 class Demo(GenericDemo):
     async def setup_a(self, websocket):
@@ -55,16 +55,16 @@ class ReplAgent(Agent):
 
     @handle_inbound_messages
     async def handle__debug__a(self, envelope, msg):#source, cmd, msg):
-        self.console_io.print_debug(".".join(envelope.msg.cmd.part_list[1:]), msg)
+        self.console_io.print_debug(envelope.msg.cmd.tail_from(1), msg)
 
     @handle_inbound_messages
     async def handle__info__a(self, envelope, msg):
         # print("consume_info", args, kwargs)
-        self.console_io.print_info(".".join(envelope.msg.cmd.part_list[1:]), msg)
+        self.console_io.print_info(envelope.msg.cmd.tail_from(1), msg)
 
     @handle_inbound_messages
     async def handle__warning__a(self, envelope, msg):
-        self.console_io.print_warning(".".join(envelope.msg.cmd.part_list[1:]), msg)
+        self.console_io.print_warning(envelope.msg.cmd.tail_from(1), msg)
 
     @handle_inbound_messages
     async def handle__error__exception__a(self, envelope, msg,  exception):
@@ -73,4 +73,4 @@ class ReplAgent(Agent):
 
     @handle_inbound_messages
     async def handle__error__additional_info__a(self, envelope, msg, additional_info):
-        self.console_io.print_error(".".join(envelope.msg.cmd.part_list[2:]), msg, additional_info)
+        self.console_io.print_error(envelope.msg.cmd.tail_from(2), msg, additional_info)